@@ -1,10 +1,12 @@
 import json
+import threading
+import types
 from typing import Callable, Union
 
 import pytest
 
 from tests import functions
-from tool2schema import LoadToolEnabled
+from tool2schema import EnableTool, LoadToolEnabled
 from tool2schema.schema import ParseException
 
 ###############################################
@@ -109,6 +111,12 @@ def test_load_missing_arguments():
         LoadToolEnabled(functions, {"name": "function"})
 
 
+@pytest.mark.parametrize("name", [["function"], {"a": 1}])
+def test_load_unhashable_name(name):
+    with pytest.raises(ParseException):
+        LoadToolEnabled(functions, {"name": name, "arguments": "{}"})
+
+
 @pytest.mark.parametrize(
     "function, arguments",
     [
@@ -148,3 +156,47 @@ def test_function_float():
     f, args = LoadToolEnabled(functions, get_function_dict(functions.function_float, {"a": 1}))
     assert f == functions.function_float
     assert args == {"a": 1}
+
+
+#####################################################
+#  Test configuration change during a refresh race  #
+#####################################################
+
+
+def test_load_config_change_during_refresh():
+    module = types.ModuleType("concurrent_tools")
+    started = threading.Event()
+    resume = threading.Event()
+
+    class Function:
+        __name__ = "function"
+
+        def __call__(self, a: int, b: str):
+            return a, b
+
+        @property
+        def __doc__(self):
+            # The docstring is read while refreshing the derived values, after the
+            # parameters have been filtered; pause the refresh of the other thread there
+            if threading.current_thread() is not threading.main_thread():
+                started.set()
+                assert resume.wait(timeout=5)
+            return "Example function."
+
+    module.function = tool = EnableTool(Function())
+    tool.config.ignore_function_description = True  # Invalidate the derived values
+
+    thread = threading.Thread(target=lambda: tool.to_json())
+    thread.start()
+
+    # Change the configuration while the other thread is refreshing the derived values
+    assert started.wait(timeout=5)
+    tool.config.ignore_all_parameters = True
+    resume.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+    # The values computed meanwhile are outdated, and must be refreshed again
+    f, args = LoadToolEnabled(module, {"name": "function", "arguments": {}})
+    assert f == tool
+    assert args == {}
@@ -1,4 +1,8 @@
 import copy
+import functools
+import inspect
+import json
+import threading
 from enum import Enum
 from typing import Callable, List, Literal, Optional
 
@@ -6,6 +10,7 @@ import pytest
 
 import tool2schema
 from tool2schema import (
+    Config,
     EnableTool,
     FindToolEnabled,
     FindToolEnabledByName,
@@ -13,8 +18,11 @@ from tool2schema import (
     FindToolEnabledByTag,
     FindToolEnabledByTagSchemas,
     FindToolEnabledSchemas,
+    FindToolEnabledSchemasJSON,
+    SaveToolEnabled,
     SchemaType,
 )
+from tool2schema.parameter_schema import ParameterSchema
 
 from . import functions
 
@@ -55,6 +63,12 @@ def test_FindToolEnabledSchemas():
     assert functions.function_union.to_json() in tool_schemas
 
 
+@pytest.mark.parametrize("schema_type", [None] + [schema for schema in SchemaType])
+def test_FindToolEnabledSchemasJSON(schema_type):
+    tool_schemas = FindToolEnabledSchemasJSON(functions, schema_type=schema_type)
+    assert json.loads(tool_schemas) == FindToolEnabledSchemas(functions, schema_type=schema_type)
+
+
 @pytest.mark.parametrize("schema_type", [schema for schema in SchemaType])
 def test_FindToolEnabledSchemas_with_type(schema_type):
     # Check that the function is found
@@ -130,6 +144,33 @@ def test_FindToolEnabledByTagSchemas_with_type(schema_type):
     assert functions.function.to_json(schema_type) not in FindToolEnabledByTagSchemas(functions, "test", schema_type=schema_type)
 
 
+##########################
+#  Test SaveToolEnabled  #
+##########################
+
+
+@pytest.mark.parametrize("schema_type", [schema for schema in SchemaType])
+def test_SaveToolEnabled(tmp_path, schema_type):
+    path = tmp_path / "schemas.json"
+    SaveToolEnabled(functions, str(path), schema_type=schema_type)
+
+    with open(path, encoding="utf-8") as fp:
+        assert json.load(fp) == FindToolEnabledSchemas(functions, schema_type=schema_type)
+
+
+##########################
+#  Test ParameterSchema  #
+##########################
+
+
+def test_ParameterSchema_docstring():
+    parameter = inspect.signature(functions.function.func).parameters["a"]
+    config = Config(tool2schema.CONFIG)
+    schema = ParameterSchema.create(parameter, 0, config, functions.function.__doc__)
+    assert schema is not None
+    assert schema.to_json()["description"] == "This is a parameter"
+
+
 ############################################
 #  Custom enum class for testing purposes  #
 ############################################
@@ -361,6 +402,114 @@ def test_function_enum():
     assert function_enum.tags == []
 
 
+##############################################
+#  Example function to test schema caching   #
+##############################################
+
+
+@EnableTool
+def function_cached(a: int, b: str, c: bool = False, d: list[int] = [1, 2, 3]):
+    """
+    This is a test function.
+
+    :param a: This is a parameter
+    :param b: This is another parameter
+    :param c: This is a boolean parameter
+    :param d: This is a list parameter
+    """
+    return a, b, c, d
+
+
+def test_function_cached_add_enum():
+    rf = ReferenceSchema(function_cached)
+    assert function_cached.to_json() == rf.schema
+    assert json.loads(function_cached.to_json_string(SchemaType.OPENAI_TUNE)) == rf.tune_schema
+
+    # Adding an enum after the schema has been generated must be reflected
+    function_cached.schema.add_enum("b", ["x", "y"])
+    rf.get_param("b")["enum"] = ["x", "y"]
+    assert function_cached.to_json() == rf.schema
+    assert json.loads(function_cached.to_json_string(SchemaType.OPENAI_TUNE)) == rf.tune_schema
+
+    # Argument validation must use the enum values as well
+    validators = {n: validate for n, _, validate in function_cached.schema.validators}
+    assert validators["b"]("x")
+    assert not validators["b"]("z")
+
+
+@EnableTool
+def function_unicode(a: str):
+    """
+    Traduit un texte en français.
+
+    :param a: Le texte à traduire
+    """
+    return a
+
+
+def test_function_unicode_json_string():
+    schema = function_unicode.to_json_string()
+    assert "Traduit un texte en français." in schema
+    assert json.loads(schema) == function_unicode.to_json()
+
+
+def test_function_signature():
+    assert inspect.signature(function_cached) is function_cached.schema.signature
+    assert inspect.signature(function_cached) == inspect.signature(function_cached.func)
+
+
+def test_function_bound_method_signature():
+    def with_signature(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs)
+
+        wrapper.__signature__ = inspect.signature(f)
+        return wrapper
+
+    class Tools:
+        @with_signature
+        def method(self, a: CustomEnum):
+            return a
+
+    tool = EnableTool(Tools().method)
+
+    # The bound method signature does not include self
+    assert list(tool.schema.signature.parameters) == ["a"]
+    assert tool("A") == CustomEnum.A
+
+
+def test_function_cached_read_only():
+    # The cached derived values cannot be modified by callers
+    with pytest.raises(TypeError):
+        del function_cached.schema.parameter_schemas["a"]  # type: ignore
+    with pytest.raises(TypeError):
+        function_cached.schema.validators[0] = None  # type: ignore
+    assert "a" in function_cached.schema.parameter_schemas
+
+
+def test_function_cached_returns_copy():
+    schema = function_cached.to_json()
+    schema["function"]["parameters"]["properties"]["d"]["items"]["type"] = "string"
+    schema["function"].pop("description")
+
+    # Modifying the returned schema must not alter the schema returned later
+    assert function_cached.to_json() != schema
+    assert function_cached.to_json()["function"]["description"] == "This is a test function."
+
+
+@EnableTool
+def function_uncopyable_default(a: int, lock: object = threading.Lock()):
+    return a
+
+
+def test_function_uncopyable_default():
+    # Default values are returned as they are, even if they cannot be copied
+    schema = function_uncopyable_default.to_json()
+    lock = inspect.signature(function_uncopyable_default.func).parameters["lock"].default
+    assert schema["function"]["parameters"]["properties"]["lock"]["default"] is lock
+
+
 #########################################
 #  Example function with no parameters  #
 #########################################
@@ -903,6 +1052,15 @@ def test_function_ignore_parameters():
     assert function_ignore_parameters.tags == []
 
 
+def test_function_ignore_parameters_tuple():
+    tool = EnableTool(function_ignore_parameters.func, ignore_parameters=("a", "d"))
+    assert tool.to_json() == function_ignore_parameters.to_json()
+
+    # The derived values are cached whatever the type of the setting
+    assert tool.schema.validators is tool.schema.validators
+    assert tool.to_json_string() is tool.to_json_string()
+
+
 #######################################
 #  Test ignore_parameter_descriptions #
 #######################################
@@ -1018,6 +1176,27 @@ def test_global_configuration_ignore_parameters(global_config):
     assert function.tags == []
 
 
+def test_global_configuration_ignore_parameters_in_place(global_config):
+    global_config.ignore_parameters = ["b", "c"]
+    assert "b" not in function.to_json()["function"]["parameters"]["properties"]
+
+    # Modifying the list in place must be reflected in the schema
+    global_config.ignore_parameters.append("a")
+    assert global_config.ignore_parameters == ["b", "c", "a"]
+    assert "a" not in function.to_json()["function"]["parameters"]["properties"]
+
+
+def test_configuration_change_is_local():
+    schema = functions.function.to_json_string()
+    function_cached.config.ignore_function_description = True
+    try:
+        # Changing the configuration of a function does not invalidate other functions
+        assert functions.function.to_json_string() is schema
+        assert "description" not in function_cached.to_json()["function"]
+    finally:
+        function_cached.config.reset_default()
+
+
 def test_global_configuration_ignore_parameter_descriptions(global_config):
     # Change the global configuration
     tool2schema.CONFIG.ignore_parameter_descriptions = True
@@ -1,10 +1,12 @@
+import sys
+from datetime import datetime
 from enum import Enum
 from typing import List, Literal, Optional, Type, Union
 
 import pytest
 from pydantic import TypeAdapter
 
-from tool2schema.type_schema import TypeSchema
+from tool2schema.type_schema import TypeSchema, ValueTypeSchema
 
 ############################################
 #  Custom enum class for testing purposes  #
@@ -47,6 +49,17 @@ def test_optional_list(type_object: Type):
     assert TypeSchema.create(type_object).to_json() == adapter.json_schema()
 
 
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y unions require Python 3.10")
+def test_union_operator():
+    for type_object in [int | None, str | float | None, list[int] | str]:
+        adapter = TypeAdapter(type_object)
+        assert TypeSchema.create(type_object).to_json() == adapter.json_schema()
+
+    type_schema = TypeSchema.create(CustomEnum | None)
+    assert type_schema.decode("YES") == CustomEnum.YES
+    assert type_schema.decode(None) is None
+
+
 ################################
 #  Test enum encoding/decoding #
 ################################
@@ -63,6 +76,13 @@ def test_union_encode_decode_enum():
     assert type_schema.decode("YES") == CustomEnum.YES
 
 
+def test_union_list_decode_enum():
+    type_schema = TypeSchema.create(Union[List[CustomEnum], str])
+
+    assert type_schema.decode(["YES", "NO"]) == [CustomEnum.YES, CustomEnum.NO]
+    assert type_schema.decode("YES") == "YES"
+
+
 @pytest.mark.parametrize(
     "array",
     [
@@ -102,3 +122,44 @@ def test_list_optional_encode_decode_enum(array):
     assert type_schema.encode(array) == encoding
     assert type_schema.decode(encoding) == array
     assert type_schema.decode(array) == array
+
+
+def test_type_map_by_name(monkeypatch):
+    # Types added to TYPE_MAP by name are mapped to the given JSON type
+    monkeypatch.setitem(ValueTypeSchema.TYPE_MAP, "datetime", "string")
+    assert TypeSchema.create(datetime).to_json() == {"type": "string"}
+
+
+def test_type_map_override(monkeypatch):
+    # Built-in types are also mapped through TYPE_MAP, so their entries can be overridden
+    monkeypatch.setitem(ValueTypeSchema.TYPE_MAP, "int", "number")
+    assert TypeSchema.create(int).to_json() == {"type": "number"}
+
+
+@pytest.mark.parametrize(
+    "type_object, identity",
+    [
+        (int, True),
+        (list, True),
+        (List[str], False),
+        (Optional[float], True),
+        (Literal["a", "b"], True),
+        (CustomEnum, False),
+        (List[CustomEnum], False),
+        (Optional[CustomEnum], False),
+    ],
+)
+def test_has_identity_decode(type_object: Type, identity: bool):
+    assert TypeSchema.create(type_object).has_identity_decode() == identity
+
+
+def test_list_decode_tuple():
+    # Values are always converted to a new list when the list has a sub-type
+    value = ["YES", "NO"]
+    assert TypeSchema.create(List[str]).decode(("YES", "NO")) == ["YES", "NO"]
+    assert TypeSchema.create(List[str]).decode(value) is not value
+    assert TypeSchema.create(list).decode(value) is value
+    assert TypeSchema.create(List[CustomEnum]).decode(("YES", "NO")) == [
+        CustomEnum.YES,
+        CustomEnum.NO,
+    ]
@@ -10,6 +10,7 @@ from .schema import (
     FindToolEnabledByTag,
     FindToolEnabledByTagSchemas,
     FindToolEnabledSchemas,
+    FindToolEnabledSchemasJSON,
     LoadToolEnabled,
     SaveToolEnabled,
 )
@@ -18,10 +18,23 @@ class Config:
     Configuration class for tool2schema.
     """
 
+    __slots__ = ("_parent", "_settings", "_initial_settings", "_version")
+
     def __init__(self, parent: Optional[Config] = None, **settings):
         self._parent = parent
         self._settings = settings
         self._initial_settings = copy.deepcopy(settings)
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented whenever a setting of this configuration or of its parents is changed,
+        so that values derived from the settings (such as cached schemas) can be refreshed.
+        """
+        if self._parent is None:
+            return self._version
+        return self._version + self._parent.version
 
     @property
     def schema_type(self) -> SchemaType:
@@ -29,14 +42,11 @@ class Config:
         Type of the schema to create.
         """
         default_value = SchemaType.OPENAI_API
-        if (fget := Config.schema_type.fget) is not None:
-            return self._get_setting(fget.__name__, default_value)
-        return default_value
+        return self._get_setting("schema_type", default_value)
 
     @schema_type.setter
     def schema_type(self, value: SchemaType):
-        if (fget := Config.schema_type.fget) is not None:
-            self._set_setting(fget.__name__, value)
+        self._set_setting("schema_type", value)
 
     @property
     def ignore_parameters(self) -> list[str]:
@@ -44,14 +54,11 @@ class Config:
         List of parameter names to ignore when creating a schema.
         """
         default_value = ["self", "args", "kwargs"]
-        if (fget := Config.ignore_parameters.fget) is not None:
-            return self._get_setting(fget.__name__, default_value)
-        return default_value
+        return self._get_setting("ignore_parameters", default_value)
 
     @ignore_parameters.setter
     def ignore_parameters(self, value: list[str]):
-        if (fget := Config.ignore_parameters.fget) is not None:
-            self._set_setting(fget.__name__, value)
+        self._set_setting("ignore_parameters", value)
 
     @property
     def ignore_function_description(self) -> bool:
@@ -59,14 +66,11 @@ class Config:
         When true, omit the function description from the schema.
         """
         default_value = False
-        if (fget := Config.ignore_function_description.fget) is not None:
-            return self._get_setting(fget.__name__, default_value)
-        return default_value
+        return self._get_setting("ignore_function_description", default_value)
 
     @ignore_function_description.setter
     def ignore_function_description(self, value: bool):
-        if (fget := Config.ignore_function_description.fget) is not None:
-            self._set_setting(fget.__name__, value)
+        self._set_setting("ignore_function_description", value)
 
     @property
     def ignore_parameter_descriptions(self) -> bool:
@@ -74,14 +78,11 @@ class Config:
         When true, omit the parameter descriptions from the schema.
         """
         default_value = False
-        if (fget := Config.ignore_parameter_descriptions.fget) is not None:
-            return self._get_setting(fget.__name__, default_value)
-        return default_value
+        return self._get_setting("ignore_parameter_descriptions", default_value)
 
     @ignore_parameter_descriptions.setter
     def ignore_parameter_descriptions(self, value: bool):
-        if (fget := Config.ignore_parameter_descriptions.fget) is not None:
-            self._set_setting(fget.__name__, value)
+        self._set_setting("ignore_parameter_descriptions", value)
 
     @property
     def ignore_all_parameters(self) -> bool:
@@ -89,20 +90,18 @@ class Config:
         When true, omit all parameters from the schema.
         """
         default_value = False
-        if (fget := Config.ignore_all_parameters.fget) is not None:
-            return self._get_setting(fget.__name__, default_value)
-        return default_value
+        return self._get_setting("ignore_all_parameters", default_value)
 
     @ignore_all_parameters.setter
     def ignore_all_parameters(self, value: bool):
-        if (fget := Config.ignore_all_parameters.fget) is not None:
-            self._set_setting(fget.__name__, value)
+        self._set_setting("ignore_all_parameters", value)
 
     def reset_default(self):
         """
         Reset the configuration to the default settings.
         """
         self._settings = copy.deepcopy(self._initial_settings)
+        self._version += 1
 
     def _get_setting(self, name: str, default):
         """
@@ -114,8 +113,10 @@ class Config:
             the settings dictionary and this configuration has no parent
         :return: The requested setting value
         """
-        fallback = default if not self._parent else getattr(self._parent, name)
-        return self._settings.get(name, fallback)
+        if name in self._settings:
+            return self._settings[name]
+        # Only resolve the parent value when this configuration does not override it
+        return default if self._parent is None else getattr(self._parent, name)
 
     def _set_setting(self, name: str, value):
         """
@@ -125,3 +126,4 @@ class Config:
         :param value: Value to set
         """
         self._settings[name] = value
+        self._version += 1
@@ -1,19 +1,51 @@
 from __future__ import annotations
 
+import functools
 import re
 from inspect import Parameter
-from typing import Any, Optional, Union
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Union
 
 from tool2schema import Config
 from tool2schema.type_schema import EnumTypeSchema, TypeSchema
 
+# Matches each ":param name: description" entry of a (whitespace normalized) docstring
+_PARAM_DOC_RE = re.compile(r":param ([^:]*): (.*?)(?=:param|:type|:return|:rtype|$)")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_param_descriptions(docstring: Optional[str]) -> Mapping[str, str]:
+    """
+    Extract the parameter descriptions from a function docstring. Results are cached
+    by docstring, thus a read-only view of the descriptions is returned.
+
+    :param docstring: The docstring of the function
+    :return: A mapping with parameter names as keys and descriptions as values.
+        When a parameter is documented more than once, the first non-empty description is used.
+    """
+    descriptions: dict[str, str] = {}
+
+    if docstring is None or ":param" not in docstring:
+        # Skip normalization and parsing when there is nothing to find
+        return MappingProxyType(descriptions)
+
+    # Splitting on any whitespace also collapses newlines and repeated spaces
+    docstring = " ".join(docstring.split())
+    for name, desc in _PARAM_DOC_RE.findall(docstring):
+        if desc and name not in descriptions:
+            descriptions[name] = desc.strip()
+
+    return MappingProxyType(descriptions)
+
 
 class ParameterSchema:
     """
     Automatically create a parameter schema given an instance of inspect.Parameter
-    and a function documentation string.
+    and the parameter descriptions extracted from the function documentation string.
     """
 
+    __slots__ = ("type_schema", "parameter", "index", "config", "docstring", "descriptions")
+
     def __init__(
         self,
         type_schema: TypeSchema,
@@ -21,6 +53,8 @@ class ParameterSchema:
         index: int,
         config: Config,
         docstring: Optional[str] = None,
+        *,
+        descriptions: Optional[Mapping[str, str]] = None,
     ):
         """
         Create a new parameter schema.
@@ -30,6 +64,8 @@ class ParameterSchema:
         :param index: The index of the parameter in the function signature
         :param config: Configuration settings to use when creating the schema
         :param docstring: The docstring for the function containing the parameter
+        :param descriptions: The parameter descriptions already extracted from the docstring
+            (keyed by parameter name), when given the docstring is not parsed again
         """
         self.type_schema = type_schema
         self.parameter = parameter
@@ -37,9 +73,18 @@ class ParameterSchema:
         self.config = config
         self.docstring = docstring
 
+        if descriptions is None:
+            descriptions = _parse_param_descriptions(docstring)
+        self.descriptions = descriptions
+
     @staticmethod
     def create(
-        parameter: Parameter, index: int, config: Config, docstring: Optional[str] = None
+        parameter: Parameter,
+        index: int,
+        config: Config,
+        docstring: Optional[str] = None,
+        *,
+        descriptions: Optional[Mapping[str, str]] = None,
     ) -> Optional[ParameterSchema]:
         """
         Create a new parameter schema for the specified parameter.
@@ -48,13 +93,14 @@ class ParameterSchema:
         :param index: The index of the parameter in the function signature
         :param config: Configuration settings to use when creating the schema
         :param docstring: The docstring for the function containing the parameter
+        :param descriptions: The parameter descriptions already extracted from the docstring
+            (keyed by parameter name), when given the docstring is not parsed again
         :return: An instance of `ParameterSchema`, or None if the parameter type is not supported.
         """
         if type_schema := TypeSchema.create(parameter.annotation):
-            return ParameterSchema(type_schema, parameter, index, config, docstring)
-
-    def _test(self) -> type[Parameter.empty]:
-        return Parameter.empty
+            return ParameterSchema(
+                type_schema, parameter, index, config, docstring, descriptions=descriptions
+            )
 
     def _get_description(self) -> Union[str, type[Parameter.empty]]:
         """
@@ -62,23 +108,17 @@ class ParameterSchema:
         to be added to the JSON schema. Return `Parameter.empty` to omit the description
         from the schema.
         """
-        if self.docstring is None or self.config.ignore_parameter_descriptions:
+        if self.config.ignore_parameter_descriptions:
             return Parameter.empty
 
-        docstring = " ".join([x.strip() for x in self.docstring.replace("\n", " ").split()])
-        params = re.findall(r":param ([^:]*): (.*?)(?=:param|:type|:return|:rtype|$)", docstring)
-        for name, desc in params:
-            if name == self.parameter.name and desc:
-                return desc.strip()
-
-        return Parameter.empty
+        return self.descriptions.get(self.parameter.name, Parameter.empty)
 
     def _get_default(self) -> Any:
         """
         Get the default value for this parameter, when present, to be added to the JSON schema.
         Return `Parameter.empty` to omit the default value from the schema.
         """
-        if self.parameter.default != Parameter.empty:
+        if self.parameter.default is not Parameter.empty:
             return self.type_schema.encode(self.parameter.default)
 
         # Not that the default value may be present but None, we use
@@ -97,12 +137,23 @@ class ParameterSchema:
         """
         Return the json schema for this parameter.
         """
-        fields = {
-            "description": self._get_description(),
-            "default": self._get_default(),
-            **self.type_schema.to_json(),
-        }
+        description = self._get_description()
+        default = self._get_default()
+        type_json = self.type_schema.to_json()
+
+        if description is Parameter.empty and default is Parameter.empty:
+            # Nothing to add, the type schema returns a new dictionary we can take over
+            return type_json
+
+        # Description and default value come first in the schema
+        json = {}
+
+        if description is not Parameter.empty:
+            json["description"] = description
+
+        if default is not Parameter.empty:
+            json["default"] = default
 
-        json = {f: v for f, v in fields.items() if v != Parameter.empty}
+        json.update(type_json)
 
         return json
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-import copy
 import functools
 import inspect
 import json
-import re
 import sys
 from inspect import Parameter
-from types import ModuleType
-from typing import Any, Callable, Generic, Literal, Optional, TypeVar, Union, overload
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Generic, Literal, Mapping, Optional, TypeVar, Union, overload
 
 import tool2schema
 from tool2schema.config import Config, SchemaType
-from tool2schema.parameter_schema import ParameterSchema
+from tool2schema.parameter_schema import ParameterSchema, _parse_param_descriptions
 
 if sys.version_info < (3, 10):
     from typing_extensions import ParamSpec
@@ -26,7 +24,8 @@ def FindToolEnabled(module: ModuleType) -> list[ToolEnabled]:
 
     :param module: Module to search for ToolEnabled functions
     """
-    return [x for x in module.__dict__.values() if hasattr(x, "tool_enabled")]
+    # An instance check avoids the cost of hasattr raising for every other module attribute
+    return [x for x in module.__dict__.values() if isinstance(x, ToolEnabled)]
 
 
 def FindToolEnabledSchemas(
@@ -41,6 +40,17 @@ def FindToolEnabledSchemas(
     return [x.to_json(schema_type) for x in FindToolEnabled(module)]
 
 
+def FindToolEnabledSchemasJSON(module: ModuleType, schema_type: Optional[SchemaType] = None) -> str:
+    """
+    Find all function schemas with the EnableTool decorator, serialized as a JSON array.
+
+    :param module: Module to search for ToolEnabled functions
+    :param schema_type: Type of schema to return (None indicates default)
+    :return: Compact JSON string of the list of schemas
+    """
+    return "[" + ",".join(x.to_json_string(schema_type) for x in FindToolEnabled(module)) + "]"
+
+
 def FindToolEnabledByName(module: ModuleType, name: str) -> Optional[ToolEnabled]:
     """
     Find a function with the EnableTool decorator by name.
@@ -48,7 +58,14 @@ def FindToolEnabledByName(module: ModuleType, name: str) -> Optional[ToolEnabled
     :param module: Module to search for ToolEnabled functions
     :param name: Name of the function to find
     """
-    func: ToolEnabled
+    # Functions are usually bound to the module under their own name (the name may come
+    # from untrusted input, only strings are looked up as they may not be hashable otherwise)
+    if isinstance(name, str):
+        func = module.__dict__.get(name)
+        if isinstance(func, ToolEnabled) and func.__name__ == name:
+            return func
+
+    # Fall back to searching functions bound under a different name
     for func in FindToolEnabled(module):
         if func.__name__ == name:
             return func
@@ -101,8 +118,14 @@ def SaveToolEnabled(module: ModuleType, path: str, schema_type: Optional[SchemaT
     :param path: Path to save the schemas to
     :param schema_type: Type of schema to return (None indicates default)
     """
-    schemas = FindToolEnabledSchemas(module, schema_type)
-    json.dump(schemas, open(path, "w"))
+    with open(path, "w", encoding="utf-8") as fp:
+        # Write the schemas one by one instead of joining them into a single string first
+        fp.write("[")
+        for i, func in enumerate(FindToolEnabled(module)):
+            if i:
+                fp.write(",")
+            fp.write(func.to_json_string(schema_type))
+        fp.write("]")
 
 
 class ParseException(Exception):
@@ -148,8 +171,9 @@ def LoadToolEnabled(
         raise ParseException("'arguments' key is missing from the dictionary")
 
     if isinstance(arguments, dict):
-        # Avoid altering the original dictionary
-        arguments = copy.deepcopy(arguments)
+        # Avoid altering the original dictionary (only top-level keys are removed
+        # during validation, thus there is no need to copy the argument values)
+        arguments = dict(arguments)
 
     elif isinstance(arguments, str):
         # Parse the JSON string
@@ -159,7 +183,8 @@ def LoadToolEnabled(
         except json.decoder.JSONDecodeError:
             raise ParseException("Arguments are not in valid JSON format")
 
-        if type(arguments) is not dict:
+        # A freshly parsed dictionary is not shared, thus it needs no copy
+        if not isinstance(arguments, dict):
             raise ParseException("Arguments are not in the form of a dictionary")
 
     else:
@@ -195,16 +220,16 @@ def _validate_arguments(f: ToolEnabled, arguments: dict, ignore_hallucinations:
     """
     validated = {}
 
-    for key, param in f.schema.parameter_schemas.items():
+    for key, required, validate in f.schema.validators:
         value = arguments.pop(key, Parameter.empty)
 
-        if value == Parameter.empty:
+        if value is Parameter.empty:
             # The parameter is missing from the arguments
-            if param.parameter.default == Parameter.empty:
+            if required:
                 # The parameter does not have a default value
                 raise ParseException(f"Required argument '{key}' is missing")
         else:
-            if not param.type_schema.validate(value):
+            if not validate(value):
                 raise ParseException(f"Argument '{key}' cannot accept value '{value}'")
 
             validated[key] = value
@@ -227,21 +252,26 @@ class ToolEnabled(Generic[P, T]):
         self.schema = FunctionSchema(func, self.config)
         self.__name__ = func.__name__
         functools.update_wrapper(self, func)
+        # Let inspect.signature reuse the signature instead of unwrapping the function again
+        self.__signature__ = self.schema.signature
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
 
-        args_list = list(args)  # Tuple is immutable, thus convert to list
+        positional, keyword = self.schema.decoders
+
+        if not keyword:
+            # No parameter requires its value to be converted
+            return self.func(*args, **kwargs)
 
-        for i, arg in enumerate(args_list):
-            for p in self.schema.parameter_schemas.values():
-                if p.index == i:
-                    # Convert the JSON value to the type expected by the method
-                    args_list[i] = p.type_schema.decode(arg)
+        # Convert the JSON values to the types expected by the method
+        args_list = [
+            decode(arg) if i < len(positional) and (decode := positional[i]) else arg
+            for i, arg in enumerate(args)
+        ]
 
-        for key in kwargs:
-            if key in self.schema.parameter_schemas:
-                # Convert the JSON value to the type expected by the method
-                kwargs[key] = self.schema.parameter_schemas[key].type_schema.decode(kwargs[key])
+        for key, value in kwargs.items():
+            if (decode := keyword.get(key)) is not None:
+                kwargs[key] = decode(value)
 
         return self.func(*args_list, **kwargs)  # type: ignore
 
@@ -257,6 +287,15 @@ class ToolEnabled(Generic[P, T]):
         """
         return self.schema.to_json(schema_type)
 
+    def to_json_string(self, schema_type: Optional[SchemaType] = None) -> str:
+        """
+        Return JSON schema for the function, serialized as a compact JSON string.
+
+        :param schema_type: None indicates default schema type
+        :return: JSON schema string
+        """
+        return self.schema.to_json_string(schema_type)
+
     def has(self, tag: str) -> bool:
         return tag in self.tags
 
@@ -281,6 +320,91 @@ def EnableTool(func: Optional[Callable[P, T]] = None, **kwargs) -> Union[ToolEna
         return wrapper
 
 
+def _copy_json(value: Any) -> Any:
+    """
+    Copy the dictionaries and lists of a JSON schema. Other values (such as encoded
+    default values) are shared, as they are not modified and may not support copying.
+
+    :param value: The JSON schema, or a value within the schema
+    :return: A copy of the given value
+    """
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+class _DerivedState:
+    """
+    Values of a function schema derived from the configuration settings. A state is
+    fully computed before it is published, so that concurrent readers always observe
+    consistent values; it is replaced as a whole when the configuration changes.
+    """
+
+    __slots__ = (
+        "version",
+        "ignore_parameters",
+        "parameter_schemas",
+        "description",
+        "required_parameters",
+        "positional_decoders",
+        "keyword_decoders",
+        "validators",
+        "json_cache",
+        "json_string_cache",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        ignore_parameters: tuple[str, ...],
+        parameter_schemas: Mapping[str, ParameterSchema],
+        description: Optional[str],
+    ):
+        """
+        Compute the values derived from the given (non-ignored) parameter schemas.
+
+        :param version: The configuration version the values are computed for
+        :param ignore_parameters: The ignored parameter names the values are computed for
+        :param parameter_schemas: Parameter schemas of the parameters which are not ignored
+        :param description: The function description, or None if omitted
+        """
+        self.version = version
+        self.ignore_parameters = ignore_parameters
+        # The values are shared with callers, thus only read-only views are exposed
+        self.parameter_schemas = MappingProxyType(dict(parameter_schemas))
+        self.description = description
+        self.required_parameters = [
+            n for n, p in parameter_schemas.items() if p.parameter.default is Parameter.empty
+        ]
+
+        # Decoders indexed by the position of the parameters in the function signature,
+        # parameters whose values never need converting have no decoder
+        positional_decoders: list[Optional[Callable]] = [None] * (
+            max((p.index for p in parameter_schemas.values()), default=-1) + 1
+        )
+        for p in parameter_schemas.values():
+            if not p.type_schema.has_identity_decode():
+                positional_decoders[p.index] = p.type_schema.decode
+
+        self.positional_decoders = tuple(positional_decoders)
+        self.keyword_decoders = MappingProxyType(
+            {
+                n: p.type_schema.decode
+                for n, p in parameter_schemas.items()
+                if not p.type_schema.has_identity_decode()
+            }
+        )
+        self.validators = tuple(
+            (n, p.parameter.default is Parameter.empty, p.type_schema.validate)
+            for n, p in parameter_schemas.items()
+        )
+
+        self.json_cache: dict[SchemaType, dict] = {}
+        self.json_string_cache: dict[SchemaType, str] = {}
+
+
 class FunctionSchema:
     """Automatically create a function schema for OpenAI."""
 
@@ -293,20 +417,64 @@ class FunctionSchema:
         """
         self.f = f
         self.config = config
+        # Reuse the signature if the function already provides one (e.g. set by other decorators),
+        # except for bound methods, whose attribute is the signature of the underlying function
+        signature = None if inspect.ismethod(f) else getattr(f, "__signature__", None)
+        if not isinstance(signature, inspect.Signature):
+            signature = inspect.signature(f)
+        self.signature = signature
         self._all_parameter_schemas: dict[str, ParameterSchema] = self._get_all_parameter_schemas()
 
+        # Values derived from the configuration, replaced by `_refresh` when it changes
+        self._state = self._get_state()
+
     def to_json(self, schema_type: Optional[SchemaType] = None) -> dict:
         """
         Convert schema to JSON.
         :param schema_type: Type of schema to return
         """
+        # Return a copy so that callers cannot alter the cached schema
+        return _copy_json(self._get_cached_json(schema_type, self._refresh()))
+
+    def to_json_string(self, schema_type: Optional[SchemaType] = None) -> str:
+        """
+        Convert schema to a compact JSON string (non-ASCII characters are not escaped).
+        :param schema_type: Type of schema to return
+        """
+        state = self._refresh()
         schema_type = schema_type or self.config.schema_type
+
+        if (schema := state.json_string_cache.get(schema_type)) is None:
+            schema = json.dumps(
+                self._get_cached_json(schema_type, state), separators=(",", ":"), ensure_ascii=False
+            )
+            state.json_string_cache[schema_type] = schema
+        return schema
+
+    def _get_cached_json(self, schema_type: Optional[SchemaType], state: _DerivedState) -> dict:
+        """
+        Return the cached JSON schema of the given type, building it if necessary.
+        :param schema_type: Type of schema to return
+        :param state: The derived values to build the schema from
+        """
+        schema_type = schema_type or self.config.schema_type
+
+        if (schema := state.json_cache.get(schema_type)) is None:
+            schema = state.json_cache[schema_type] = self._get_json(schema_type, state)
+        return schema
+
+    def _get_json(self, schema_type: SchemaType, state: _DerivedState) -> dict:
+        """
+        Build the JSON schema of the given type.
+        :param schema_type: Type of schema to build
+        :param state: The derived values to build the schema from
+        """
         if schema_type == SchemaType.OPENAI_TUNE:
-            return self._get_function_schema(schema_type)
+            return self._get_function_schema(schema_type, state)
         elif schema_type == SchemaType.ANTHROPIC_CLAUDE:
-            return self._get_function_schema(schema_type)
+            return self._get_function_schema(schema_type, state)
 
-        return self._get_schema()
+        return self._get_schema(state)
 
     def add_enum(self, n: str, enum: list) -> FunctionSchema:
         """
@@ -317,16 +485,27 @@ class FunctionSchema:
         :return: This function schema
         """
         self._all_parameter_schemas[n].add_enum(enum)
+
+        # The decoders and validators depend on the parameter types, recompute them
+        # with empty caches, so that the schemas are rebuilt when next requested
+        state = self._state
+        self._state = _DerivedState(
+            state.version, state.ignore_parameters, state.parameter_schemas, state.description
+        )
+
         return self
 
-    def _get_schema(self) -> dict:
+    def _get_schema(self, state: _DerivedState) -> dict:
         """
         Get the complete schema dictionary.
         """
         # This dictionary is only used with the API schema type
-        return {"type": "function", "function": self._get_function_schema(SchemaType.OPENAI_API)}
+        return {
+            "type": "function",
+            "function": self._get_function_schema(SchemaType.OPENAI_API, state),
+        }
 
-    def _get_function_schema(self, schema_type: SchemaType) -> dict:
+    def _get_function_schema(self, schema_type: SchemaType, state: _DerivedState) -> dict:
         """
         Get the function schema dictionary.
         """
@@ -335,37 +514,37 @@ class FunctionSchema:
         need_empty_param = schema_type in [
             SchemaType.OPENAI_TUNE,
             SchemaType.ANTHROPIC_CLAUDE]
-        if self.parameter_schemas or need_empty_param:
+        if state.parameter_schemas or need_empty_param:
             # If the schema type is tune, add the dictionary even if there are no parameters
             if schema_type == SchemaType.ANTHROPIC_CLAUDE:
-                schema["input_schema"] = self._get_parameters_schema()
+                schema["input_schema"] = self._get_parameters_schema(state)
             else:
-                schema["parameters"] = self._get_parameters_schema()
+                schema["parameters"] = self._get_parameters_schema(state)
 
-        if (description := self._get_description()) is not None:
+        if (description := state.description) is not None:
             # Add the function description even if it is an empty string
             schema["description"] = description
 
         return schema
 
-    def _get_parameters_schema(self) -> dict:
+    def _get_parameters_schema(self, state: _DerivedState) -> dict:
         """
         Get the parameters schema dictionary.
         """
-        schema = {"type": "object", "properties": self._get_parameter_properties_schema()}
+        schema = {"type": "object", "properties": self._get_parameter_properties_schema(state)}
 
-        if required := self._get_required_parameters():
+        if required := self._get_required_parameters(state):
             schema["required"] = required
 
         return schema
 
-    def _get_parameter_properties_schema(self) -> dict:
+    def _get_parameter_properties_schema(self, state: _DerivedState) -> dict:
         """
         Get the properties schema for the function.
         """
         schema = dict()
 
-        for n, p in self.parameter_schemas.items():
+        for n, p in state.parameter_schemas.items():
             schema[n] = p.to_json()
 
         return schema
@@ -379,9 +558,13 @@ class FunctionSchema:
             parameter schemas as values
         """
         parameters = dict()
+        docstring = self.f.__doc__
+        descriptions = _parse_param_descriptions(docstring)
 
-        for i, (n, o) in enumerate(inspect.signature(self.f).parameters.items()):
-            if schema := ParameterSchema.create(o, i, self.config, self.f.__doc__):
+        for i, (n, o) in enumerate(self.signature.parameters.items()):
+            if schema := ParameterSchema.create(
+                o, i, self.config, docstring, descriptions=descriptions
+            ):
                 parameters[n] = schema
 
         return parameters
@@ -395,40 +578,95 @@ class FunctionSchema:
         if not (docstring := self.f.__doc__) or self.config.ignore_function_description:
             return None
 
-        docstring = " ".join([x.strip() for x in docstring.replace("\n", " ").split()])
-        if desc := re.findall(r"(.*?):param", docstring):
-            return desc[0].strip()
+        # Splitting on any whitespace also collapses newlines and repeated spaces
+        docstring = " ".join(docstring.split())
+        if (i := docstring.find(":param")) == -1:
+            # The whole docstring is the description
+            return docstring
 
-        return docstring.strip()
+        # The description is everything preceding the first parameter
+        return docstring[:i].strip()
 
-    def _get_required_parameters(self) -> list[str]:
+    def _get_required_parameters(self, state: _DerivedState) -> list[str]:
         """
         Get the list of required parameters.
 
         :return: The list of parameters without a default value
         """
-        req_params = []
-        for n, p in self.parameter_schemas.items():
-            if p.parameter.default == Parameter.empty:
-                req_params.append(n)
+        # Return a copy as the list is included in the schema being built
+        return list(state.required_parameters)
 
-        return req_params
+    @property
+    def decoders(self) -> tuple[tuple[Optional[Callable], ...], Mapping[str, Callable]]:
+        """
+        Return the functions converting JSON values to the types expected by the function,
+        both as a tuple indexed by the position of the parameters in the function signature
+        (ignored parameters are represented by None), and as a read-only mapping keyed by
+        parameter name (ignored parameters are not included). Parameters whose values are
+        never converted have no decoder.
+
+        :return: A tuple with the positional and the keyword decoders
+        """
+        state = self._refresh()
+        return state.positional_decoders, state.keyword_decoders
 
     @property
-    def parameter_schemas(self) -> dict[str, ParameterSchema]:
+    def validators(self) -> tuple[tuple[str, bool, Callable[[Any], bool]], ...]:
         """
-        Return a dictionary of parameter schemas, where keys are parameter names
+        Return a tuple with one tuple per (non-ignored) parameter, consisting of the parameter
+        name, whether the parameter is required, and the function validating its JSON values.
+
+        :return: A tuple of parameter validators
+        """
+        return self._refresh().validators
+
+    @property
+    def parameter_schemas(self) -> Mapping[str, ParameterSchema]:
+        """
+        Return a read-only mapping of parameter schemas, where keys are parameter names
         and values are instances of `ParameterSchema`. Ignored parameters are not
-        included in the dictionary.
+        included in the mapping.
+
+        :return: A mapping of parameter schemas
+        """
+        return self._refresh().parameter_schemas
+
+    def _refresh(self) -> _DerivedState:
+        """
+        Return the values derived from the configuration settings, recomputing
+        them if the configuration has changed since they were last computed.
+        """
+        if not self._is_current(state := self._state):
+            # Publish the new state only once it is complete
+            state = self._state = self._get_state()
+        return state
 
-        :return: A dictionary of parameter schemas
+    def _is_current(self, state: _DerivedState) -> bool:
+        """
+        Return true if the given values were computed from the current configuration settings.
         """
+        # The ignored parameters list may also have been modified in place
         return (
-            {}
-            if self.config.ignore_all_parameters
-            else {
-                k: v
-                for k, v in self._all_parameter_schemas.items()
-                if k not in self.config.ignore_parameters
+            state.version == self.config.version
+            and state.ignore_parameters == tuple(self.config.ignore_parameters)
+        )
+
+    def _get_state(self) -> _DerivedState:
+        """
+        Compute the values derived from the current configuration settings.
+        """
+        # Read the version first, so that changes made meanwhile cause another refresh
+        version = self.config.version
+        ignore_parameters = tuple(self.config.ignore_parameters)
+
+        if self.config.ignore_all_parameters:
+            parameter_schemas = {}
+        else:
+            ignored = set(ignore_parameters)
+            parameter_schemas = {
+                k: v for k, v in self._all_parameter_schemas.items() if k not in ignored
             }
+
+        return _DerivedState(
+            version, ignore_parameters, parameter_schemas, self._get_description()
         )
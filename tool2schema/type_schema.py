@@ -1,14 +1,49 @@
 from __future__ import annotations
 
+import types
 import typing
-from enum import Enum
-from inspect import Parameter, isclass
-from typing import Literal, Optional, Type, Union
+from enum import Enum, EnumMeta
+from inspect import Parameter
+from typing import Any, Literal, Optional, Type, Union
 
 # Order matters: specific classes should appear before more generic ones,
 # because the first matching schema will be used
 TYPE_SCHEMAS: list[Type[TypeSchema]] = []
 
+# Schemas for the most common non-generic types and for generic types
+# (keyed by their origin), checked before scanning TYPE_SCHEMAS
+_FAST_DISPATCH: dict[Type, Type[TypeSchema]] = {}
+_ORIGIN_DISPATCH: dict[Any, Type[TypeSchema]] = {}
+
+# Unlike typing.get_origin, reading __origin__ from typing.Annotated returns the annotated type
+_AnnotatedAlias = type(typing.Annotated[int, None])
+
+# Unions written as X | Y (Python 3.10+) have no __origin__ attribute
+_UnionType = getattr(types, "UnionType", None)
+
+# Origins of union types, both typing.Union[X, Y] (including typing.Optional) and X | Y
+_UNION_ORIGINS = (Union,) if _UnionType is None else (Union, _UnionType)
+
+
+def _get_origin(p_type: Any) -> Any:
+    """
+    Equivalent of `typing.get_origin`, reading the `__origin__` attribute directly
+    to avoid the dispatch overhead of the typing module.
+    """
+    if (t := type(p_type)) is _AnnotatedAlias:
+        return typing.Annotated
+    if t is _UnionType:
+        return _UnionType
+    return getattr(p_type, "__origin__", None)
+
+
+def _get_args(p_type: Any) -> tuple:
+    """
+    Equivalent of `typing.get_args` for the generic types supported by the type schemas
+    (lists, unions and literals), reading the `__args__` attribute directly.
+    """
+    return getattr(p_type, "__args__", ())
+
 
 def ToolTypeSchema(cls: Type[TypeSchema]):
     """
@@ -16,6 +51,9 @@ def ToolTypeSchema(cls: Type[TypeSchema]):
     """
     cls.priority = len(TYPE_SCHEMAS)
     TYPE_SCHEMAS.insert(0, cls)  # Push to the front
+    # The new schema may take precedence over the ones in the dispatch tables
+    _FAST_DISPATCH.clear()
+    _ORIGIN_DISPATCH.clear()
     return cls
 
 
@@ -24,6 +62,8 @@ class TypeSchema:
     Base class for type converters.
     """
 
+    __slots__ = ("type",)
+
     # Priority of this type schema (to be overridden by child classes),
     # the higher the priority, the more specific the type schema is;
     # schemas with higher priority will be checked first
@@ -41,6 +81,13 @@ class TypeSchema:
 
         :return: An instance of `TypeSchema`, or None if the type is not supported.
         """
+        if type(p_type) is type:
+            # Only plain classes are looked up, other annotations may not be hashable
+            if (schema := _FAST_DISPATCH.get(p_type)) is not None:
+                return schema(p_type)
+        elif (schema := _ORIGIN_DISPATCH.get(_get_origin(p_type))) is not None:
+            return schema(p_type)
+
         for schema in TYPE_SCHEMAS:
             if schema.matches(p_type):
                 return schema(p_type)
@@ -76,6 +123,15 @@ class TypeSchema:
         """
         return value
 
+    def has_identity_decode(self) -> bool:
+        """
+        Return true if `decode` always returns the given value as is, in which
+        case callers can skip decoding altogether.
+
+        :return: True if decoding never converts values
+        """
+        return type(self).decode is TypeSchema.decode
+
     def validate(self, value) -> bool:
         """
         Return true if the given value can be considered an instance of this type or can be
@@ -109,15 +165,20 @@ class TypeSchema:
 
     def to_json(self) -> dict:
         """
-        Return the json schema for this type.
+        Return the json schema for this type. A new dictionary is returned on every call,
+        so callers are free to add entries to it.
         """
-        fields = {
-            "items": self._get_items(),
-            "enum": self._get_enum(),
-            **self._get_type(),
-        }
+        json = {}
+
+        if (items := self._get_items()) is not Parameter.empty:
+            json["items"] = items
+
+        if (enum := self._get_enum()) is not Parameter.empty:
+            json["enum"] = enum
 
-        return {f: v for f, v in fields.items() if v != Parameter.empty}
+        json.update(self._get_type())
+
+        return json
 
 
 @ToolTypeSchema
@@ -126,6 +187,8 @@ class ValueTypeSchema(TypeSchema):
     Type schema for value types.
     """
 
+    __slots__ = ("_json_type",)
+
     TYPE_MAP = {
         "int": "integer",
         "float": "number",
@@ -134,6 +197,19 @@ class ValueTypeSchema(TypeSchema):
         "NoneType": "null",
     }
 
+    def __init__(self, p_type: Optional[Type] = None):
+        super().__init__(p_type)
+        # The JSON type only depends on the type, thus resolve it once
+        self._json_type = "null" if p_type is None else self._map_type(p_type)
+
+    @classmethod
+    def _map_type(cls, p_type: Type) -> str:
+        """
+        :return: The JSON type corresponding to the given type.
+        """
+        name = getattr(p_type, "__name__", None)
+        return cls.TYPE_MAP.get(name, "object") if isinstance(name, str) else "object"
+
     @staticmethod
     def matches(p_type) -> bool:
         return True
@@ -145,9 +221,7 @@ class ValueTypeSchema(TypeSchema):
         return self.type == type(value)
 
     def _get_type(self) -> dict:
-        if self.type is not None:
-            return {"type": self.TYPE_MAP.get(self.type.__name__, "object")}
-        return {"type": "null"}
+        return {"type": self._json_type}
 
 
 class GenericTypeSchema(TypeSchema):
@@ -155,11 +229,20 @@ class GenericTypeSchema(TypeSchema):
     Base class for generic types supporting subscription.
     """
 
+    __slots__ = ("_sub_types",)
+
+    def __init__(self, p_type: Optional[Type] = None):
+        super().__init__(p_type)
+        # The type arguments never change, so resolve their schemas only once
+        self._sub_types = [
+            t for arg in _get_args(p_type) if (t := TypeSchema.create(arg)) is not None
+        ]
+
     def _get_sub_types(self) -> list[TypeSchema]:
         """
         :return: A list of type schemas corresponding to the generic type arguments.
         """
-        return [t for arg in typing.get_args(self.type) if (t := TypeSchema.create(arg)) is not None]
+        return self._sub_types
 
     def _get_sub_type(self) -> Optional[TypeSchema]:
         """
@@ -177,9 +260,20 @@ class ListTypeSchema(GenericTypeSchema):
     Type schema for list (array) types, including typing.List.
     """
 
+    __slots__ = ("_item_decode",)
+
+    def __init__(self, p_type: Optional[Type] = None):
+        super().__init__(p_type)
+        # Values are converted to a new list when there is a sub-type, but the items
+        # themselves are only converted when the sub-type actually converts values
+        sub_type = self._get_sub_type()
+        self._item_decode = (
+            sub_type.decode if sub_type and not sub_type.has_identity_decode() else None
+        )
+
     @staticmethod
     def matches(p_type: Type) -> bool:
-        return p_type != Parameter.empty and (p_type is list or typing.get_origin(p_type) is list)
+        return p_type is not Parameter.empty and (p_type is list or _get_origin(p_type) is list)
 
     def _get_type(self) -> dict:
         return {"type": "array"}
@@ -197,10 +291,17 @@ class ListTypeSchema(GenericTypeSchema):
         return value
 
     def decode(self, value):
-        if sub_type := self._get_sub_type():
-            return [sub_type.decode(v) for v in value]
+        # Only sequences are converted, strings would otherwise be split into characters
+        if self._get_sub_type() is None or not isinstance(value, (list, tuple)):
+            return value
 
-        return value
+        if (decode := self._item_decode) is not None:
+            return [decode(v) for v in value]
+
+        return list(value)
+
+    def has_identity_decode(self) -> bool:
+        return self._get_sub_type() is None
 
     def validate(self, value) -> bool:
         if type(value) is not list:
@@ -215,12 +316,25 @@ class ListTypeSchema(GenericTypeSchema):
 @ToolTypeSchema
 class UnionTypeSchema(GenericTypeSchema):
     """
-    Type schema for typing.Optional types.
+    Type schema for union types, including typing.Optional and X | Y unions.
     """
 
+    __slots__ = ("_priority_sub_types", "_decoding_sub_types")
+
+    def __init__(self, p_type: Optional[Type] = None):
+        super().__init__(p_type)
+        # The priorities never change, so sort the sub-types only once
+        self._priority_sub_types = sorted(
+            self._get_sub_types(), key=lambda t: t.priority, reverse=True
+        )
+        # Sub-types which never convert values cannot change the outcome of decoding
+        self._decoding_sub_types = [
+            t for t in self._priority_sub_types if not t.has_identity_decode()
+        ]
+
     @staticmethod
     def matches(p_type: Type) -> bool:
-        return p_type != Parameter.empty and typing.get_origin(p_type) is Union
+        return p_type is not Parameter.empty and _get_origin(p_type) in _UNION_ORIGINS
 
     def _get_type(self) -> dict:
         return {"anyOf": [t.to_json() for t in self._get_sub_types()]}
@@ -229,7 +343,7 @@ class UnionTypeSchema(GenericTypeSchema):
         """
         :return: Subtypes sorted by priority.
         """
-        return sorted(self._get_sub_types(), key=lambda t: t.priority, reverse=True)
+        return self._priority_sub_types
 
     def encode(self, value):
         # Delegate encoding to the first matching subtype
@@ -242,12 +356,15 @@ class UnionTypeSchema(GenericTypeSchema):
     def decode(self, value):
         # We have no way to know which type to decode to, so we try all of them
         # (ordered by priority) and return at the first one that produces a different value.
-        for sub_type in self._sorted_sub_types():
+        for sub_type in self._decoding_sub_types:
             if (dec := sub_type.decode(value)) != value:
                 return dec
 
         return value
 
+    def has_identity_decode(self) -> bool:
+        return all(sub_type.has_identity_decode() for sub_type in self._get_sub_types())
+
     def validate(self, value) -> bool:
         return any(sub_type.validate(value) for sub_type in self._get_sub_types())
 
@@ -257,6 +374,8 @@ class EnumTypeSchema(TypeSchema):
     Base type schema form enumeration types.
     """
 
+    __slots__ = ("enum_values",)
+
     def __init__(self, enum_values, type: Optional[Type] = None):
         super().__init__(type)
         self.enum_values = enum_values
@@ -279,13 +398,22 @@ class EnumClassTypeSchema(EnumTypeSchema):
     Type schema for enum.Enum types.
     """
 
+    __slots__ = ("_enum_names",)
+
     def __init__(self, p_type: Type[Enum]):
         self.type: Type[Enum]
         super().__init__([e.name for e in p_type], p_type)
+        # Set of the names for constant time membership tests when decoding
+        self._enum_names = frozenset(self.enum_values)
 
     @staticmethod
     def matches(p_type: Type) -> bool:
-        return p_type != Parameter.empty and isclass(p_type) and issubclass(p_type, Enum)
+        # Every enum class is an instance of EnumMeta (also when using a derived metaclass)
+        return isinstance(p_type, EnumMeta)
+
+    def _get_type(self) -> dict:
+        # Enumerations are listed by name, which is always a string
+        return {"type": "string"}
 
     def encode(self, value):
         """
@@ -301,7 +429,9 @@ class EnumClassTypeSchema(EnumTypeSchema):
 
         :param value: The enum name to be converted
         """
-        if value in self.enum_values and self.type is not None:
+        # Enum names are strings, checking the type first also avoids
+        # hashing values which may not be hashable (e.g. lists)
+        if isinstance(value, str) and value in self._enum_names and self.type is not None:
             # Convert to an enum instance
             return self.type[value]
 
@@ -315,10 +445,32 @@ class LiteralTypeSchema(EnumTypeSchema):
     Type schema for typing.Literal types.
     """
 
+    __slots__ = ()
+
     def __init__(self, p_type):
-        values = list(typing.get_args(p_type))
+        values = list(_get_args(p_type))
         super().__init__(values, p_type)
 
     @staticmethod
     def matches(p_type: Type) -> bool:
-        return p_type != Parameter.empty and typing.get_origin(p_type) is Literal
+        return p_type is not Parameter.empty and _get_origin(p_type) is Literal
+
+
+_FAST_DISPATCH.update(
+    {
+        int: ValueTypeSchema,
+        float: ValueTypeSchema,
+        str: ValueTypeSchema,
+        bool: ValueTypeSchema,
+        type(None): ValueTypeSchema,
+        list: ListTypeSchema,
+    }
+)
+
+_ORIGIN_DISPATCH.update(
+    {
+        list: ListTypeSchema,
+        Literal: LiteralTypeSchema,
+        **{o: UnionTypeSchema for o in _UNION_ORIGINS},
+    }
+)